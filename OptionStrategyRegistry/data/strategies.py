@@ -1,18 +1,223 @@
 import os
 import yaml
 import logging
+import functools
+import math
 import numpy as np
 import pandas as pd
 from scipy.stats import norm
+from numba import njit, prange, guvectorize, float32, float64
 from typing import Optional, Tuple
 from abc import ABC, abstractmethod
 from ..utilities import get_config_folder, Registry
 from .definitions import OptionPayoff
 
-
 logger = logging.getLogger(__name__)
 
 
+# opt type codes used in strategy definitions, anything else is a forward
+_OPT_TYPE_MAP = {
+    "C": OptionPayoff.CALL,
+    "P": OptionPayoff.PUT,
+    "F": OptionPayoff.FORWARD,
+}
+
+# fastmath without nnan/ninf: deltas outside (0, 1) map to nan/inf strikes
+# (e.g. positive put deltas) and those must propagate through the payoff
+_FASTMATH_FINITE_SAFE = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# underlyings per block in the payoff kernel, sized so a block of u and out sits in L1
+_PAYOFF_BLOCK = 1024
+
+# precisions the payoff kernels are compiled for
+_PAYOFF_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _check_payoff_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in _PAYOFF_DTYPES:
+        raise ValueError(f"dtype must be np.float32 or np.float64, got {dtype}.")
+    return dtype
+
+
+# out[lo:hi] += sum_j weights[j] * max(signs[j] * (u[lo:hi] - strikes[j]), 0)
+# legs outer, so the slice of out stays in cache and the inner loop vectorizes
+@njit(fastmath=_FASTMATH_FINITE_SAFE, cache=True)
+def _payoff_block(u, strikes, signs, weights, out, lo, hi):
+    zero = out.dtype.type(0)
+    for j in range(strikes.size):
+        sign, strike, weight = signs[j], strikes[j], weights[j]
+        for i in range(lo, hi):
+            out[i] += max(sign * (u[i] - strike), zero) * weight
+
+
+# fused payoff kernel, blocks of u in parallel, accumulates in the dtype of u
+@njit(parallel=True, fastmath=_FASTMATH_FINITE_SAFE, cache=True)
+def _payoff_kernel(u, strikes, signs, weights):
+    n = u.size
+    out = np.zeros_like(u)
+    for b in prange((n + _PAYOFF_BLOCK - 1) // _PAYOFF_BLOCK):
+        lo = b * _PAYOFF_BLOCK
+        _payoff_block(u, strikes, signs, weights, out, lo, min(lo + _PAYOFF_BLOCK, n))
+    return out
+
+
+def _payoff_gufunc_body(u, strikes, signs, weights, out):
+    n = u.size
+    out[:] = 0
+    for lo in range(0, n, _PAYOFF_BLOCK):
+        _payoff_block(u, strikes, signs, weights, out, lo, min(lo + _PAYOFF_BLOCK, n))
+
+
+# same payoff as a gufunc, broadcasts over leading (scenario) axes of strikes
+# built on first use, eager guvectorize compilation would add ~1s to every import
+@functools.cache
+def _payoff_gufunc():
+    return guvectorize(
+        [
+            (float64[:], float64[:], float64[:], float64[:], float64[:]),
+            (float32[:], float32[:], float32[:], float32[:], float32[:]),
+        ],
+        "(n),(l),(l),(l)->(n)",
+        nopython=True,
+        target="parallel",
+        cache=True,
+    )(_payoff_gufunc_body)
+
+
+# Acklam's rational approximation coefficients, highest order first
+_ACKLAM_A = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_ACKLAM_B = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+    1.0,
+)
+_ACKLAM_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_ACKLAM_D = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+    1.0,
+)
+_ACKLAM_P_LOW = 0.02425
+
+
+@njit(fastmath=_FASTMATH_FINITE_SAFE, cache=True)
+def _polyval(coeffs, x):
+    acc = 0.0
+    for c in coeffs:
+        acc = acc * x + c
+    return acc
+
+
+# inverse standard normal cdf, Acklam's approximation plus one Halley step
+@njit(fastmath=_FASTMATH_FINITE_SAFE, cache=True)
+def _norm_ppf(p):
+    if not 0.0 < p < 1.0:
+        if p == 0.0:
+            return -math.inf
+        if p == 1.0:
+            return math.inf
+        return math.nan
+
+    # work in the lower half, 1 - p is exact for p >= 0.5 and keeps the tail accurate
+    lo = p if p <= 0.5 else 1.0 - p
+    if lo < _ACKLAM_P_LOW:
+        q = math.sqrt(-2.0 * math.log(lo))
+        x = _polyval(_ACKLAM_C, q) / _polyval(_ACKLAM_D, q)
+    else:
+        q = lo - 0.5
+        r = q * q
+        x = q * _polyval(_ACKLAM_A, r) / _polyval(_ACKLAM_B, r)
+
+    # refine to full double precision
+    e = 0.5 * math.erfc(-x / math.sqrt(2.0)) - lo
+    u = e * math.sqrt(2.0 * math.pi) * math.exp(0.5 * x * x)
+    x = x - u / (1.0 + 0.5 * x * u)
+    return x if p <= 0.5 else -x
+
+
+# compiled scalar counterpart of strikes_from_deltas
+@njit(fastmath=_FASTMATH_FINITE_SAFE, cache=True)
+def _strike_from_delta_nb(
+    delta, is_put, underlying, vol, time_to_expiry, is_log_normal
+):
+
+    if is_put:
+        delta = 1.0 + delta
+
+    cutoff = _norm_ppf(delta)
+    var = vol * vol * time_to_expiry
+
+    if is_log_normal:
+        return underlying / math.exp(cutoff * math.sqrt(var) - 0.5 * var)
+    else:
+        return underlying - cutoff * math.sqrt(var)
+
+
+# memoized strike translation, strategies in the registry share common delta strikes
+@functools.lru_cache(maxsize=1024)
+def _strike_from_delta_cached(
+    delta: float,
+    opt_type: int,
+    underlying: float,
+    vol: float,
+    time_to_expiry: float,
+    is_log_normal: bool,
+):
+
+    return _strike_from_delta_nb(
+        float(delta),
+        opt_type == OptionPayoff.PUT,
+        float(underlying),
+        float(vol),
+        float(time_to_expiry),
+        bool(is_log_normal),
+    )
+
+
+# batched counterpart, keyed on the raw bytes of the delta array
+@functools.lru_cache(maxsize=1024)
+def _strikes_from_deltas_cached(
+    deltas_key: bytes,
+    opt_types: tuple,
+    underlying: float,
+    vol: float,
+    time_to_expiry: float,
+    is_log_normal: bool,
+):
+
+    strikes = OptionStrategy.strikes_from_deltas(
+        np.frombuffer(deltas_key, dtype=np.float64),
+        opt_types,
+        underlying,
+        vol,
+        time_to_expiry,
+        is_log_normal,
+    )
+    # shared across callers, must not be mutated in place
+    strikes.setflags(write=False)
+    return strikes
+
+
 ### Option Strategy Class that Supports Arithemtics (see demo)
 class OptionStrategy:
 
@@ -21,28 +226,29 @@ class OptionStrategy:
     def __init__(self, name: str, content: dict):
         self.name_ = name
         self.content_ = content
+        self._set_legs(
+            [k[0] for k in content], [k[1] for k in content], list(content.values())
+        )
+
+    # struct-of-arrays view of the legs, consumed by run
+    def _set_legs(self, opt_types, deltas, weights):
+        self.opt_types_ = tuple(opt_types)
+        self.deltas_ = np.asarray(deltas, dtype=np.float64)
+        self.weights_ = np.asarray(weights, dtype=np.float64)
+        self.signs_ = np.array(
+            [1.0 if t == OptionPayoff.CALL else -1.0 for t in self.opt_types_],
+            dtype=np.float64,
+        )
 
     @classmethod
     def createFromDict(cls, name: str, content: dict):
         # validation
-        lst = []
-        for k, v in content.items():
+        assert len(content) == len(OptionStrategy.schema)
+        for k in OptionStrategy.schema:
             assert k in content
-            lst.append(v)
-        assert len(lst) == len(OptionStrategy.schema)
-
-        # build content dict
-        # key   : (opt_type, delta_strike)
-        # value : weight
-        result = {}
-        for i in range(len(lst[0])):
-            t = OptionPayoff.FORWARD
-            if lst[0][i].upper() == "C":
-                t = OptionPayoff.CALL
-            elif lst[0][i].upper() == "P":
-                t = OptionPayoff.PUT
-            result[(t, lst[1][i])] = lst[2][i]
-        return OptionStrategy(name, result)
+        return cls.createFromList(
+            name, content["OPT_TYPE"], content["DELTA_STRIKE"], content["WEIGHT"]
+        )
 
     @classmethod
     def createFromList(
@@ -52,14 +258,10 @@ class OptionStrategy:
         # build content dict
         # key   : (opt_type, delta_strike)
         # value : weight
-        result = {}
-        for i in range(len(opt_types)):
-            t = OptionPayoff.FORWARD
-            if opt_types[i].upper() == "C":
-                t = OptionPayoff.CALL
-            elif opt_types[i].upper() == "P":
-                t = OptionPayoff.PUT
-            result[(t, delta_strikes[i])] = weights[i]
+        result = {
+            (_OPT_TYPE_MAP.get(t.upper(), OptionPayoff.FORWARD), d): w
+            for t, d, w in zip(opt_types, delta_strikes, weights)
+        }
         return OptionStrategy(name, result)
 
     ### simple getters
@@ -84,10 +286,32 @@ class OptionStrategy:
         is_log_normal: bool,
     ):
 
-        if opt_type == OptionPayoff.PUT:
-            delta = 1.0 + delta
+        # array inputs broadcast through the vectorized path, only scalars are memoized
+        inputs = (delta, opt_type, underlying, vol, time_to_expiry)
+        if any(np.ndim(x) > 0 for x in inputs):
+            return OptionStrategy.strikes_from_deltas(
+                delta, opt_type, underlying, vol, time_to_expiry, is_log_normal
+            )
+        return _strike_from_delta_cached(
+            delta, opt_type, underlying, vol, time_to_expiry, is_log_normal
+        )
 
-        cutoff = norm.ppf(delta)
+    # batched version of strike_from_delta, one norm.ppf call for all legs
+    @staticmethod
+    def strikes_from_deltas(
+        deltas: list,
+        opt_types: list,
+        underlying: float,
+        vol: float,
+        time_to_expiry: float,
+        is_log_normal: bool,
+    ):
+
+        d = np.asarray(deltas, dtype=np.float64)
+        is_put = np.asarray(opt_types) == OptionPayoff.PUT
+        d = np.where(is_put, 1.0 + d, d)
+
+        cutoff = norm.ppf(d)
         var = vol * vol * time_to_expiry
 
         if is_log_normal:
@@ -109,62 +333,106 @@ class OptionStrategy:
         time_to_expiry: float,
         vol: float,
         is_log_normal: Optional[bool] = True,
+        dtype: Optional[type] = np.float64,
     ):
-        # strike translation
-        strikes_map = {}
-        for k, v in self.content_.items():
-            strikes_map[k[1]] = OptionStrategy.strike_from_delta(
-                k[1], k[0], forward, vol, time_to_expiry, is_log_normal
-            )
+        # strike translation (one strike per leg)
+        strikes = _strikes_from_deltas_cached(
+            self.deltas_.tobytes(),
+            self.opt_types_,
+            forward,
+            vol,
+            time_to_expiry,
+            is_log_normal,
+        )
 
         # payoff sampling
-        result = []
-        for x in underlying_rng:
-            acc = 0.0
-            for k, v in self.content.items():
-                acc += OptionStrategy.payoff_helper(x, strikes_map[k[1]], k[0]) * v
-            result.append([x, acc])
-        return pd.DataFrame(result, columns=["FORWARD", "PAYOFF"])
+        # np.float32 halves memory traffic on large grids, at single precision
+        dtype = _check_payoff_dtype(dtype)
+        u = np.array(underlying_rng, dtype=np.float64).ravel()
+        payoff = _payoff_kernel(
+            u.astype(dtype, copy=False),
+            strikes.astype(dtype, copy=False),
+            self.signs_.astype(dtype, copy=False),
+            self.weights_.astype(dtype, copy=False),
+        )
+        # u is copied from the input above and payoff is fresh, pandas need not copy
+        return pd.DataFrame({"FORWARD": u, "PAYOFF": payoff}, copy=False)
+
+    # payoff over a set of (forward, vol, expiry) scenarios, one column per scenario
+    def run_batch(
+        self,
+        underlying_rng: list,
+        forwards: list,
+        time_to_expiries: list,
+        vols: list,
+        is_log_normal: Optional[bool] = True,
+        dtype: Optional[type] = np.float64,
+    ):
+        dtype = _check_payoff_dtype(dtype)
+        forwards, time_to_expiries, vols = np.broadcast_arrays(
+            np.asarray(forwards, dtype=np.float64).ravel(),
+            np.asarray(time_to_expiries, dtype=np.float64).ravel(),
+            np.asarray(vols, dtype=np.float64).ravel(),
+        )
+
+        # strike translation, (S, 1) scenarios against (L,) legs -> (S, L)
+        strikes = OptionStrategy.strikes_from_deltas(
+            self.deltas_,
+            self.opt_types_,
+            forwards[:, None],
+            vols[:, None],
+            time_to_expiries[:, None],
+            is_log_normal,
+        )
+
+        # payoff sampling, (S, N)
+        u = np.array(underlying_rng, dtype=np.float64).ravel()
+        payoff = _payoff_gufunc()(
+            u.astype(dtype, copy=False),
+            strikes.astype(dtype, copy=False),
+            self.signs_.astype(dtype, copy=False),
+            self.weights_.astype(dtype, copy=False),
+        )
+        columns = pd.MultiIndex.from_arrays(
+            [forwards, time_to_expiries, vols],
+            names=["FORWARD", "TIME_TO_EXPIRY", "VOL"],
+        )
+        return pd.DataFrame(
+            payoff.T, index=pd.Index(u, name="UNDERLYING"), columns=columns
+        )
 
     ### operator overloading
 
     def __contains__(self, key: Tuple):
-        return (key[0], key[1]) in self.content
+        return key in self.content_
 
     def __getitem__(self, key: Tuple):
-        if not self.content.__contains__(key):
+        try:
+            return self.content_[key]
+        except KeyError:
             raise Exception(
                 f"{key[0]} and {key[1]} is not part of strategy definition."
             )
-        return self.content[(key[0], key[1])]
 
     def __len__(self):
-        return len(self.content)
+        return len(self.content_)
 
     def __add__(self, in_strategy: "OptionStrategy"):
-        content = dict()
-        traversed_keys = []
-        for k, v in self.content.items():
-            content[k] = v
-            if k in in_strategy.content:
-                content[k] += in_strategy[k]
-                traversed_keys.append(k)
-            if content[k] == 0.0:
-                content.pop(k)
-        for k, v in in_strategy.content.items():
-            if k not in traversed_keys:
-                content[k] = v
+        a, b = self.content, in_strategy.content
+        # dict union keeps leg order: self first, then legs new in in_strategy
+        content = {k: a.get(k, 0) + b.get(k, 0) for k in a | b}
+        content = {k: v for k, v in content.items() if v != 0.0}
         return OptionStrategy(f"{self.name}_ADD_{in_strategy.name}", content)
 
     def __mul__(self, scaler: float):
-        content = dict()
-        for k, v in self.content.items():
-            if scaler != 0.0:
-                content[k] = v * scaler
+        content = (
+            {k: v * scaler for k, v in self.content.items()} if scaler != 0.0 else {}
+        )
         return OptionStrategy(f"{self.name}_SCALED_BY_{scaler}", content)
 
 
 ### Option Strategy Registry
 class OptionStrategyRegistry(Registry):
 
-### TODO
\ No newline at end of file
+    ### TODO
+    pass
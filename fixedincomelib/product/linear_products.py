@@ -31,6 +31,26 @@ from fixedincomelib.date import (
 )
 from fixedincomelib.product.product_portfolio import ProductPortfolio
 
+# (index, fixing calendar, business day convention, currency code) per index name,
+# an entry is only reused while the registry still hands out the same index
+_ON_INDEX_META: dict[
+    str, tuple[ql.QuantLib.OvernightIndex, ql.QuantLib.Calendar, int, str]
+] = {}
+
+
+def _get_on_index_meta(
+    name: str, on_index: ql.QuantLib.OvernightIndex
+) -> tuple[ql.QuantLib.Calendar, int, str]:
+    meta = _ON_INDEX_META.get(name)
+    if meta is None or meta[0] is not on_index:
+        meta = _ON_INDEX_META[name] = (
+            on_index,
+            on_index.fixingCalendar(),
+            on_index.businessDayConvention(),
+            on_index.currency().code(),
+        )
+    return meta[1:]
+
 
 class ProductBulletCashflow(Product):
 
@@ -154,18 +174,20 @@ class ProductOvernightIndexCashflow(Product):
         self.on_index_: ql.QuantLib.OvernightIndex = IndexRegistry().get(
             self.on_index_str_
         )
+        calendar, business_day_convention, currency_code = _get_on_index_meta(
+            self.on_index_str_, self.on_index_
+        )
         # sort out date
         self.first_date_ = self.effective_date_ = effective_date
         self.termination_date_ = term_or_termination_date.get_date()
         if term_or_termination_date.is_term():
-            calendar: ql.QuantLib.Calendar = self.on_index_.fixingCalendar()
             self.termination_date_ = Date(
                 calendar.advance(
                     self.effective_date_,
                     term_or_termination_date.get_term(),
-                    self.on_index.businessDayConvention(),
+                    business_day_convention,
                 )
-            )  # need to find a way to get biz_day_conv from index
+            )
         self.last_date_ = self.termination_date_
         self.paymentDate_ = (
             self.termination_date_ if payment_date is None else payment_date
@@ -175,7 +197,7 @@ class ProductOvernightIndexCashflow(Product):
         self.long_or_short_ = LongOrShort.LONG if notional >= 0 else LongOrShort.SHORT
         self.compounding_method_ = compounding_method
         self.spread_ = spread
-        self.currency_ = Currency(self.on_index_.currency().code())
+        self.currency_ = Currency(currency_code)
 
     @property
     def on_index(self) -> ql.QuantLib.OvernightIndex:
@@ -286,20 +308,75 @@ class InterestRateStream(ProductPortfolio):
         ),
         rule: Optional[str] = "BACKWARD",
         end_of_month: Optional[bool] = False,
+        # prebuilt schedule from a stream with identical schedule inputs
+        schedule: Optional[pd.DataFrame] = None,
     ):
 
         if float_index is None and fixed_rate is None:
             raise Exception("Cannot have both floating index and fixed rate invalid.")
 
-        ### TODO
-        # use utilities functions to make schedule
+        if schedule is None:
+            schedule = make_schedule(
+                effective_date,
+                termination_date,
+                accrual_period,
+                holiday_convention,
+                buseinss_day_convention,
+                accrual_basis,
+                rule,
+                end_of_month,
+                fixing_in_arrear,
+                payment_offset=payment_offset,
+                payment_business_day_convention=payment_business_day_convention,
+                payment_holiday_convention=payment_holiday_convention,
+            )
 
-        products, weights = [], []
+        # one cashflow per period, floating when an index is given, fixed otherwise
+        products = [None] * len(schedule)
+        weights = [1.0] * len(schedule)
 
-        ### TODO
+        # iterate columns directly, iterrows would box every row into a Series
+        for i, (start_date, end_date, payment_date) in enumerate(
+            zip(
+                schedule["StartDate"].to_numpy(),
+                schedule["EndDate"].to_numpy(),
+                schedule["PaymentDate"].to_numpy(),
+            )
+        ):
+            # schedule dates are already resolved, convert once per period
+            start_date = Date(start_date)
+            end_date = Date(end_date)
+            payment_date = Date(payment_date)
+            if float_index is not None:
+                # a concrete date, so the cashflow skips its own calendar advance
+                products[i] = ProductOvernightIndexCashflow(
+                    start_date,
+                    TermOrTerminationDate(end_date),
+                    float_index,
+                    ois_compounding,
+                    ois_spread,
+                    notional,
+                    payment_date,
+                )
+            else:
+                products[i] = ProductFixedAccrued(
+                    start_date,
+                    end_date,
+                    currency,
+                    notional,
+                    accrual_basis,
+                    payment_date,
+                    buseinss_day_convention,
+                    holiday_convention,
+                )
 
+        self.schedule_ = schedule
         super().__init__(products, weights)
 
+    @property
+    def schedule(self) -> pd.DataFrame:
+        return self.schedule_
+
     def cashflow(self, i: int) -> Product:
         return self.element(i)
 
@@ -339,23 +416,25 @@ class ProductRFRSwap(Product):
         self.on_index_: ql.QuantLib.OvernightIndex = IndexRegistry().get(
             self.on_index_str_
         )
+        calendar, business_day_convention, currency_code = _get_on_index_meta(
+            self.on_index_str_, self.on_index_
+        )
         self.pay_business_day_convention_ = pay_business_day_convention
         self.pay_holiday_convention_ = pay_holiday_convention
         self.first_date_ = self.effective_date_ = effective_date
         self.term_or_termination_date_ = term_or_termination_date
         self.termination_date_ = self.term_or_termination_date_.get_date()
         if self.term_or_termination_date_.is_term():
-            calendar = self.on_index_.fixingCalendar()
             self.termination_date_ = Date(
                 calendar.advance(
                     self.effective_date_,
                     self.term_or_termination_date_.get_term(),
-                    self.on_index_.businessDayConvention(),
+                    business_day_convention,
                 )
             )
         self.last_date_ = self.termination_date_
         # other attributes
-        self.currency_ = Currency(self.on_index_.currency().code())
+        self.currency_ = Currency(currency_code)
         self.fixed_rate_ = fixed_rate
         self.notional_ = notional
         self.spread_ = spread
@@ -373,10 +452,43 @@ class ProductRFRSwap(Product):
         fixed_leg_sign = 1.0 if self.pay_or_rec_ == PayOrReceive.PAY else -1.0
 
         # floating leg
-        ### TODO
+        self.floating_leg_ = InterestRateStream(
+            self.effective_date_,
+            self.termination_date_,
+            self.floating_leg_accrual_period_,
+            -fixed_leg_sign * self.notional_,
+            self.currency_,
+            self.accrual_basis_,
+            self.pay_business_day_convention_,
+            self.pay_holiday_convention_,
+            float_index=self.on_index_str_,
+            ois_compounding=self.compounding_method_,
+            ois_spread=self.spread_,
+            payment_offset=self.pay_offset_,
+            payment_business_day_convention=self.pay_business_day_convention_,
+            payment_holiday_convention=self.pay_holiday_convention_,
+        )
 
         # fixed leg
-        ### TODO
+        # same accrual period means the same schedule, skip rebuilding it
+        shared_schedule = None
+        if self.accrual_period_ == self.floating_leg_accrual_period_:
+            shared_schedule = self.floating_leg_.schedule
+        self.fixed_leg_ = InterestRateStream(
+            self.effective_date_,
+            self.termination_date_,
+            self.accrual_period_,
+            fixed_leg_sign * self.notional_,
+            self.currency_,
+            self.accrual_basis_,
+            self.pay_business_day_convention_,
+            self.pay_holiday_convention_,
+            fixed_rate=self.fixed_rate_,
+            payment_offset=self.pay_offset_,
+            payment_business_day_convention=self.pay_business_day_convention_,
+            payment_holiday_convention=self.pay_holiday_convention_,
+            schedule=shared_schedule,
+        )
 
     def floating_leg_cash_flow(self, i: int) -> Product:
         assert 0 <= i < self.floating_leg_.num_cashflows()
@@ -0,0 +1,112 @@
+import os
+import pytest
+
+from fixedincomelib.apis.product import qfCreateProductRFRSwap
+from fixedincomelib.date import Date, Period
+from fixedincomelib.market import (
+    AccrualBasis,
+    BusinessDayConvention,
+    Currency,
+    HolidayConvention,
+    IndexRegistry,
+)
+from fixedincomelib.product.linear_products import (
+    InterestRateStream,
+    ProductFixedAccrued,
+    ProductOvernightIndexCashflow,
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def index_registry():
+    # registries load their static files relative to a folder next to fixedincomelib
+    cwd = os.getcwd()
+    os.chdir(os.path.join(os.path.dirname(__file__), os.pardir, "Assignment"))
+    IndexRegistry.reset_registry()
+    IndexRegistry()
+    yield
+    IndexRegistry.reset_registry()
+    os.chdir(cwd)
+
+
+def make_stream(**kwargs):
+    return InterestRateStream(
+        Date("2025-05-27"),
+        Date("2027-05-25"),
+        Period("1Y"),
+        1e6,
+        Currency("USD"),
+        AccrualBasis("ACT/360"),
+        BusinessDayConvention("F"),
+        HolidayConvention("USGS"),
+        **kwargs,
+    )
+
+
+def test_fixed_stream():
+    stream = make_stream(fixed_rate=0.04)
+    assert stream.num_cashflows() == 2
+    for i in range(stream.num_cashflows()):
+        assert isinstance(stream.cashflow(i), ProductFixedAccrued)
+        assert stream.weight(i) == 1.0
+    # notional is the sum of the cashflow notionals, the rate does not scale it
+    assert stream.notional == 2e6
+
+
+def test_floating_stream():
+    stream = make_stream(float_index="SOFR-1B")
+    assert stream.num_cashflows() == 2
+    for i in range(stream.num_cashflows()):
+        assert isinstance(stream.cashflow(i), ProductOvernightIndexCashflow)
+        assert stream.weight(i) == 1.0
+    assert stream.notional == 2e6
+    assert stream.cashflow(0).termination_date == stream.cashflow(1).effective_date
+
+
+def test_stream_needs_rate_or_index():
+    with pytest.raises(Exception):
+        make_stream()
+
+
+def make_swap(pay_or_rec="pay", floating_leg_accrual_period="1Y"):
+    # the notebook's 2Y 4% SOFR swap
+    return qfCreateProductRFRSwap(
+        "2025-05-25",
+        "2Y",
+        "2D",
+        "SOFR-1B",
+        0.04,
+        pay_or_rec,
+        1e6,
+        "1Y",
+        "ACT/360",
+        floating_leg_accrual_period,
+        "F",
+        "USGS",
+        0.005,
+        "compound",
+    )
+
+
+def test_rfr_swap_legs():
+    swap = make_swap()
+    assert swap.fixed_leg_.num_cashflows() == 2
+    assert swap.floating_leg_.num_cashflows() == 2
+    assert swap.floating_leg_cash_flow(1).notional == -1e6
+    assert swap.fixed_leg_cash_flow(1).notional == 1e6
+    assert swap.fixed_leg_.notional == -swap.floating_leg_.notional == 2e6
+
+
+def test_rfr_swap_receive_flips_legs():
+    swap = make_swap(pay_or_rec="receive")
+    assert swap.floating_leg_cash_flow(1).notional == 1e6
+    assert swap.fixed_leg_cash_flow(1).notional == -1e6
+
+
+def test_rfr_swap_schedule_sharing():
+    swap = make_swap()
+    assert swap.fixed_leg_.schedule is swap.floating_leg_.schedule
+    swap = make_swap(floating_leg_accrual_period="6M")
+    assert swap.fixed_leg_.schedule is not swap.floating_leg_.schedule
+    assert swap.fixed_leg_.num_cashflows() == 2
+    assert swap.floating_leg_.num_cashflows() == 4
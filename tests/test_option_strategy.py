@@ -0,0 +1,185 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from OptionStrategyRegistry.data.definitions import OptionPayoff
+from OptionStrategyRegistry.data.strategies import (
+    OptionStrategy,
+    _PAYOFF_BLOCK,
+    _norm_ppf,
+    _strikes_from_deltas_cached,
+)
+
+
+def test_norm_ppf_matches_scipy():
+    # central region, both tails and the branch boundaries of the approximation
+    p = np.concatenate(
+        [
+            np.linspace(1e-6, 1.0 - 1e-6, 2001),
+            np.logspace(-300, -3, 200),
+            1.0 - np.logspace(-16, -3, 200),
+            [0.02425, 0.97575, 0.5],
+        ]
+    )
+    expected = stats.norm.ppf(p)
+    actual = np.array([_norm_ppf(x) for x in p])
+    rel_err = np.abs(actual - expected) / np.maximum(1.0, np.abs(expected))
+    assert rel_err.max() < 1e-14
+
+
+@pytest.mark.parametrize(
+    "p, expected",
+    [(0.0, -np.inf), (1.0, np.inf), (-0.5, np.nan), (1.5, np.nan), (np.nan, np.nan)],
+)
+def test_norm_ppf_edges(p, expected):
+    assert np.array_equal(_norm_ppf(p), expected, equal_nan=True)
+    assert np.array_equal(stats.norm.ppf(p), expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("is_log_normal, vol", [(True, 0.2), (False, 20.0)])
+def test_strike_from_delta_scalar_matches_array(is_log_normal, vol):
+    deltas = np.array([0.1, 0.25, 0.5, -0.25, -0.9])
+    opt_types = np.array(
+        [OptionPayoff.CALL] * 3 + [OptionPayoff.PUT] * 2, dtype=np.int64
+    )
+    # array inputs take the scipy path, scalars the compiled one
+    batched = OptionStrategy.strike_from_delta(
+        deltas, opt_types, 100.0, vol, 1.5, is_log_normal
+    )
+    scalar = [
+        OptionStrategy.strike_from_delta(
+            float(d), int(t), 100.0, vol, 1.5, is_log_normal
+        )
+        for d, t in zip(deltas, opt_types)
+    ]
+    np.testing.assert_allclose(scalar, batched, rtol=1e-13)
+
+
+def test_run_dtype():
+    strategy = OptionStrategy.createFromList(
+        "STRANGLE", ["C", "P"], [0.25, -0.25], [1, 1]
+    )
+    u = np.linspace(50.0, 150.0, 11)
+    res = strategy.run(u, 100.0, 1.0, 0.2, dtype=np.float32)
+    # forward grid stays at full precision, only the payoff is single precision
+    assert res["FORWARD"].dtype == np.float64 and res["PAYOFF"].dtype == np.float32
+    np.testing.assert_array_equal(res["FORWARD"].values, u)
+    with pytest.raises(ValueError):
+        strategy.run(u, 100.0, 1.0, 0.2, dtype=int)
+    with pytest.raises(ValueError):
+        strategy.run_batch(u, [100.0], 1.0, 0.2, dtype=np.int64)
+
+
+def test_run_batch_matches_run():
+    strategy = OptionStrategy.createFromList(
+        "RISK_REVERSAL", ["C", "P"], [0.25, -0.25], [1, -1]
+    )
+    u = np.linspace(50.0, 150.0, 2049)
+    forwards, time_to_expiries, vols = [95.0, 100.0, 105.0], [0.5, 1.0, 2.0], 0.2
+    res = strategy.run_batch(u, forwards, time_to_expiries, vols)
+    assert res.index.name == "UNDERLYING"
+    assert res.columns.names == ["FORWARD", "TIME_TO_EXPIRY", "VOL"]
+    np.testing.assert_array_equal(res.index.values, u)
+    for f, t, v in res.columns:
+        expected = strategy.run(u, f, t, v)["PAYOFF"].values
+        np.testing.assert_allclose(res[(f, t, v)].values, expected, rtol=1e-12)
+
+
+def reference_payoff(opt_types, deltas, weights, u, forward, t, vol, is_log_normal):
+    # per-leg strikes and a dense payoff matrix, no caching or compiled kernels
+    is_put = np.array([o == "P" for o in opt_types])
+    d = np.where(is_put, 1.0 + np.asarray(deltas), np.asarray(deltas))
+    cutoff, var = stats.norm.ppf(d), vol * vol * t
+    if is_log_normal:
+        strikes = forward / np.exp(cutoff * np.sqrt(var) - 0.5 * var)
+    else:
+        strikes = forward - cutoff * np.sqrt(var)
+    signs = np.where(is_put, -1.0, 1.0)
+    return np.maximum(signs * (u[:, None] - strikes), 0.0) @ np.asarray(weights)
+
+
+@pytest.mark.parametrize("is_log_normal", [True, False])
+@pytest.mark.parametrize(
+    "opt_types, deltas, weights",
+    [
+        (["C", "P"], [0.25, -0.25], [1, -1]),
+        (["C", "C", "P"], [0.25, 0.5, -0.1], [1, -2, 0.5]),
+        # positive put delta, as in the shipped ATM_STRADDLE: nan strike
+        (["C", "P"], [0.5, 0.5], [1, 1]),
+    ],
+)
+def test_run_matches_reference(opt_types, deltas, weights, is_log_normal):
+    strategy = OptionStrategy.createFromList("X", opt_types, deltas, weights)
+    vol = 0.2 if is_log_normal else 20.0
+    # not a multiple of the block size, so the tail block is exercised
+    u = np.linspace(50.0, 150.0, 2 * _PAYOFF_BLOCK + 37)
+    res = strategy.run(u, 100.0, 1.0, vol, is_log_normal)
+    expected = reference_payoff(
+        opt_types, deltas, weights, u, 100.0, 1.0, vol, is_log_normal
+    )
+    np.testing.assert_array_equal(res["FORWARD"].values, u)
+    np.testing.assert_allclose(res["PAYOFF"].values, expected, rtol=1e-12)
+
+
+def test_call_and_put_sharing_a_delta_keep_their_own_strikes():
+    strategy = OptionStrategy.createFromList("X", ["C", "P"], [0.5, 0.5], [1, 1])
+    strikes = _strikes_from_deltas_cached(
+        strategy.deltas_.tobytes(), strategy.opt_types_, 100.0, 0.2, 1.0, True
+    )
+    # the call is not overwritten by the put's nan strike
+    np.testing.assert_allclose(strikes[0], 100.0 * np.exp(0.5 * 0.04), rtol=1e-14)
+    assert np.isnan(strikes[1])
+
+
+def test_add():
+    a = OptionStrategy.createFromList("A", ["C", "P"], [0.25, -0.25], [1, 1])
+    b = OptionStrategy.createFromList(
+        "B", ["C", "P", "C"], [0.25, -0.25, 0.5], [2, -1, 0]
+    )
+    res = a + b
+    assert res.name == "A_ADD_B"
+    # overlapping legs are summed, cancelled and zero-weight legs are dropped
+    assert res.content == {(OptionPayoff.CALL, 0.25): 3}
+    # weights keep their input type, as in the baseline
+    assert isinstance(res[(OptionPayoff.CALL, 0.25)], int)
+    res = a + OptionStrategy.createFromList("C", ["P"], [-0.1], [1])
+    assert isinstance(res[(OptionPayoff.PUT, -0.1)], int)
+    # legs keep their order, self first
+    assert list(res.content) == [
+        (OptionPayoff.CALL, 0.25),
+        (OptionPayoff.PUT, -0.25),
+        (OptionPayoff.PUT, -0.1),
+    ]
+
+
+def test_mul():
+    a = OptionStrategy.createFromList("A", ["C", "P"], [0.25, -0.25], [1, -2])
+    res = a * 1.5
+    assert res.name == "A_SCALED_BY_1.5"
+    assert res.content == {
+        (OptionPayoff.CALL, 0.25): 1.5,
+        (OptionPayoff.PUT, -0.25): -3.0,
+    }
+    assert len(a * 0.0) == 0
+    u = np.linspace(50.0, 150.0, 11)
+    np.testing.assert_allclose(
+        res.run(u, 100.0, 1.0, 0.2)["PAYOFF"], 1.5 * a.run(u, 100.0, 1.0, 0.2)["PAYOFF"]
+    )
+
+
+def test_create_from_dict_validates_schema():
+    content = {"OPT_TYPE": ["C", "P"], "DELTA_STRIKE": [0.25, -0.25], "WEIGHT": [1, 1]}
+    strategy = OptionStrategy.createFromDict("STRANGLE", content)
+    assert strategy.content == {
+        (OptionPayoff.CALL, 0.25): 1,
+        (OptionPayoff.PUT, -0.25): 1,
+    }
+    missing = {k: v for k, v in content.items() if k != "DELTA_STRIKE"}
+    with pytest.raises(AssertionError):
+        OptionStrategy.createFromDict("STRANGLE", missing)
+    # same number of keys but one of them is not in the schema
+    renamed = {**missing, "DELTA": [0.25, -0.25]}
+    with pytest.raises(AssertionError):
+        OptionStrategy.createFromDict("STRANGLE", renamed)
+    with pytest.raises(AssertionError):
+        OptionStrategy.createFromDict("STRANGLE", {**content, "EXTRA": [0, 0]})